@@ -0,0 +1,64 @@
+"""
+Content-addressable on-disk cache for Claude extractions.
+Each entry is stored as ./llm_cache/<sha256>.json, keyed by everything that
+went into the prompt, so re-polling the same posting skips the API call.
+
+Set LLM_CACHE_DISABLED=1 to bypass the cache.
+"""
+
+import os
+import hashlib
+import logging
+import tempfile
+
+import orjson
+
+CACHE_DIR = os.environ.get("LLM_CACHE_DIR", "llm_cache")
+
+log = logging.getLogger(__name__)
+
+
+def is_disabled() -> bool:
+    return os.environ.get("LLM_CACHE_DISABLED") == "1"
+
+
+def make_key(*fields: str) -> str:
+    """Hash the fields with an 8-byte length prefix each, so field boundaries can't collide."""
+    h = hashlib.sha256()
+    for field in fields:
+        data = field.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _path(key: str) -> str:
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def get(key: str) -> dict | None:
+    """Return the cached value for key, or None on a miss."""
+    if is_disabled():
+        return None
+    try:
+        with open(_path(key), "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"Ignoring unreadable cache entry {key}: {e}")
+        return None
+
+
+def set(key: str, value: dict):
+    """Store value under key. Written via a temp file so readers never see a partial entry."""
+    if is_disabled():
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(value))
+        os.replace(tmp, _path(key))
+    except Exception as e:
+        log.warning(f"Failed to write cache entry {key}: {e}")
@@ -8,14 +8,25 @@ Runs as a cron job every 5-15 minutes.
 
 import os
 import re
-import json
+import functools
 import time
 import logging
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from typing import Literal
+from datetime import date, datetime, timezone
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import anthropic
-from notion_client import Client as NotionClient
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from notion_client import APIErrorCode, APIResponseError, Client as NotionClient
+from notion_client.helpers import iterate_paginated_api
+from selectolax.lexbor import LexborHTMLParser
+
+import llm_cache
 
 # ── Config ──────────────────────────────────────────────────────────────────
 SLACK_BOT_TOKEN = os.environ["SLACK_BOT_TOKEN"]
@@ -27,14 +38,89 @@ NOTION_DATABASE_ID = os.environ.get(
 
 SLACK_CHANNEL_ID = os.environ.get("SLACK_CHANNEL_ID", "C0ADKCQTZHU")  # #growth-openings
 LAST_TS_FILE = "last_processed_ts.txt"
+KNOWN_URLS_FILE = "known_urls.txt"
+LINKS_REFRESH_SECONDS = 600  # re-scan Notion for existing links every 10 minutes
+
+EXTRACTION_MODEL = "claude-haiku-4-5-20251001"
+FALLBACK_MODEL = "claude-sonnet-4-20250514"  # used when the extraction model errors or keeps returning invalid details
+EXTRACTION_MAX_TOKENS = 400
+PROMPT_VERSION = "v4"  # bump when EXTRACTION_INSTRUCTIONS change to invalidate llm_cache
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 log = logging.getLogger(__name__)
 
+# ── Patterns ────────────────────────────────────────────────────────────────
+# Slack wraps URLs in angle brackets: <https://example.com> or <url|label>
+_SLACK_URL_RE = re.compile(r"<(https?://[^>|]+)(?:\|[^>]*)?>")
+_PLAIN_URL_RE = re.compile(r"https?://[^\s<>\"]+")
+_HTML_URL_RE = re.compile(r'https?://[^\s<>"\'\\,;)}\]]+')
+_ACTIVITY_RE = re.compile(r"activity[:-](\d+)")
+# ATS postings that have a public JSON API: (board/company, job id)
+_GREENHOUSE_RE = re.compile(r"(?:job-)?boards\.greenhouse\.io/([^/?#]+)/jobs/(\d+)")
+_LEVER_RE = re.compile(r"jobs\.lever\.co/([^/?#]+)/([0-9a-f-]{36})")
+_ASHBY_RE = re.compile(r"jobs\.ashbyhq\.com/([^/?#]+)/([0-9a-f-]{36})")
+
 # ── Clients ─────────────────────────────────────────────────────────────────
 claude = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
 notion = NotionClient(auth=NOTION_TOKEN)
 
+# Shared HTTP session: keep-alive sockets are reused across polls, so repeat
+# requests to Slack/LinkedIn/job boards skip the TCP+TLS handshake.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+})
+_adapter = HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+# Slack 429s are not retried here: the first one reaches fetch_new_messages, and
+# the scheduler waits out Retry-After on its interruptible sleep.
+_slack_adapter = HTTPAdapter(
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]),
+)
+SESSION.mount("https://slack.com/", _slack_adapter)
+
+# Page fetches and Claude calls are pure I/O wait, so they run on a shared pool
+# (kept below the Session's pool_maxsize so workers never block on a socket).
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+SLACK_HEADERS = {"Authorization": f"Bearer {SLACK_BOT_TOKEN}"}
+MAX_PAGE_BYTES = 64_000
+MAX_PAGE_CHARS = 15000
+
+
+# ── Errors ──────────────────────────────────────────────────────────────────
+class RateLimited(Exception):
+    """An API answered 429; the scheduler should wait `retry_after` seconds before polling again."""
+
+    service = "API"
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"{self.service} rate limited, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class SlackRateLimited(RateLimited):
+    service = "Slack"
+
+
+class NotionRateLimited(RateLimited):
+    service = "Notion"
+
+
+def raise_if_notion_rate_limited(e: Exception):
+    """Re-raise a Notion 429 as NotionRateLimited instead of letting it pass as a generic failure."""
+    if isinstance(e, APIResponseError) and e.code == APIErrorCode.RateLimited:
+        raise NotionRateLimited(int(e.headers.get("Retry-After", "30"))) from e
+
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 def get_last_processed_ts() -> str:
@@ -46,24 +132,28 @@ def get_last_processed_ts() -> str:
 
 
 def save_last_processed_ts(ts: str):
-    """Persist the latest processed timestamp."""
-    with open(LAST_TS_FILE, "w") as f:
+    """Persist the latest processed timestamp (atomically, so a crash can't truncate it)."""
+    tmp = LAST_TS_FILE + ".tmp"
+    with open(tmp, "w") as f:
         f.write(ts)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, LAST_TS_FILE)
 
 
 def extract_urls(text: str) -> list[str]:
     """Extract URLs from a Slack message (handles Slack's <url> format)."""
-    # Slack wraps URLs in angle brackets: <https://example.com>
-    slack_urls = re.findall(r"<(https?://[^>|]+)(?:\|[^>]*)?>", text)
+    slack_urls = _SLACK_URL_RE.findall(text)
     if slack_urls:
         return slack_urls
     # Fallback: plain URLs
-    return re.findall(r"https?://[^\s<>\"]+", text)
+    return _PLAIN_URL_RE.findall(text)
 
 
+@functools.lru_cache(maxsize=1024)
 def decode_linkedin_activity_date(url: str) -> str | None:
     """Extract date from LinkedIn activity ID in the URL."""
-    match = re.search(r"activity[:-](\d+)", url)
+    match = _ACTIVITY_RE.search(url)
     if match:
         activity_id = int(match.group(1))
         timestamp_ms = activity_id >> 22
@@ -72,20 +162,50 @@ def decode_linkedin_activity_date(url: str) -> str | None:
     return None
 
 
+def fetch_ats_posting(url: str) -> str | None:
+    """Fetch a posting as JSON from its ATS's public API, or None if the URL isn't a known ATS."""
+    try:
+        if match := _GREENHOUSE_RE.search(url):
+            board, job_id = match.groups()
+            resp = SESSION.get(f"https://boards-api.greenhouse.io/v1/boards/{board}/jobs/{job_id}", timeout=15)
+            resp.raise_for_status()
+            return resp.text
+        if match := _LEVER_RE.search(url):
+            company, job_id = match.groups()
+            resp = SESSION.get(f"https://api.lever.co/v0/postings/{company}/{job_id}", timeout=15)
+            resp.raise_for_status()
+            return resp.text
+        if match := _ASHBY_RE.search(url):
+            # Ashby only exposes the whole board, so pick the posting out of it
+            board, job_id = match.groups()
+            resp = SESSION.get(
+                f"https://api.ashbyhq.com/posting-api/job-board/{board}",
+                params={"includeCompensation": "true"},
+                timeout=15,
+            )
+            resp.raise_for_status()
+            for job in orjson.loads(resp.content).get("jobs", []):
+                if job.get("id") == job_id:
+                    return orjson.dumps(job).decode()
+    except Exception as e:
+        log.warning(f"ATS API fetch failed for {url}, falling back to the page: {e}")
+    return None
+
+
 def fetch_page_content(url: str) -> str:
     """Fetch the text content of a job posting URL."""
+    # Known ATS postings come back as a small structured JSON payload instead of HTML
+    posting = fetch_ats_posting(url)
+    if posting:
+        return posting[:MAX_PAGE_CHARS]
     try:
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            )
-        }
-        resp = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-        resp.raise_for_status()
-        # Return first 15k chars to stay within context limits
-        return resp.text[:15000]
+        with SESSION.get(url, timeout=15, allow_redirects=True, stream=True) as resp:
+            resp.raise_for_status()
+            # Read a bounded prefix of the decompressed body; 64KB covers the
+            # 15k-char context limit even for multi-byte encodings
+            raw = resp.raw.read(MAX_PAGE_BYTES, decode_content=True)
+            # apparent_encoding would download the whole body, so fall back to UTF-8
+            return raw.decode(resp.encoding or "utf-8", errors="replace")[:MAX_PAGE_CHARS]
     except Exception as e:
         log.warning(f"Failed to fetch {url}: {e}")
         return ""
@@ -109,13 +229,23 @@ JOB_BOARD_PATTERNS = [
     "wellfound.com",
     "linkedin.com/jobs/view",
 ]
+_JOB_BOARD_RE = re.compile("|".join(map(re.escape, JOB_BOARD_PATTERNS)))
 
 
-def extract_job_urls_from_page(page_content: str, source_url: str) -> list[str]:
-    """Extract job board URLs embedded within a LinkedIn post page."""
-    # Find all URLs in the HTML content
-    raw_urls = re.findall(r'https?://[^\s<>"\'\\,;)}\]]+', page_content)
+def categorize_urls(urls: list[str]) -> tuple[str | None, list[str]]:
+    """Split message URLs into the LinkedIn post URL (if any) and direct job URLs."""
+    linkedin_post_url = None
+    job_urls = []
+    for u in urls:
+        if "linkedin.com" in u and ("/feed/" in u or "/posts/" in u or "activity" in u):
+            linkedin_post_url = u
+        else:
+            job_urls.append(u)
+    return linkedin_post_url, job_urls
+
 
+def _filter_job_urls(raw_urls: list[str], source_url: str) -> list[str]:
+    """Keep unique job board URLs, dropping the source URL itself."""
     job_urls = []
     seen = set()
     for url in raw_urls:
@@ -125,15 +255,111 @@ def extract_job_urls_from_page(page_content: str, source_url: str) -> list[str]:
         if url == source_url:
             continue
         # Check if it matches a known job board
-        if any(domain in url for domain in JOB_BOARD_PATTERNS):
+        if _JOB_BOARD_RE.search(url):
             if url not in seen:
                 seen.add(url)
                 job_urls.append(url)
+    return job_urls
+
+
+def extract_job_urls_from_page(page_content: str, source_url: str) -> list[str]:
+    """Extract job board URLs embedded within a LinkedIn post page."""
+    # Only link targets are candidates, which skips script/style asset URLs
+    tree = LexborHTMLParser(page_content)
+    raw_urls = [
+        href for node in tree.css("a[href]")
+        if (href := node.attributes.get("href") or "").startswith("http")
+    ]
+    job_urls = _filter_job_urls(raw_urls, source_url)
+
+    # Fallback: job links that only appear as plain text in the HTML
+    if not job_urls:
+        job_urls = _filter_job_urls(_HTML_URL_RE.findall(page_content), source_url)
 
     log.info(f"Found {len(job_urls)} job board URL(s) inside page: {job_urls}")
     return job_urls
 
 
+class JobDetails(BaseModel):
+    """Schema for the extraction tool; Claude's tool input is validated against it."""
+    company_name: str | None = Field(None, description="Company name")
+    open_role: str | None = Field(None, description="Job title")
+    job_type: Literal["Full-time", "Part-time"] = Field("Full-time", description="Full-time or Part-time")
+    location: str | None = Field(None, description="Location(s), semicolon-separated if multiple")
+    compensation_range: str | None = Field(None, description="Salary/comp range if listed")
+    link_to_apply: str | None = Field(None, description="Direct application URL if found in the page, otherwise null")
+    job_listed_date: date | None = Field(None, description="Date the job was posted (YYYY-MM-DD), or null if not found")
+
+    @field_validator("job_type", mode="before")
+    @classmethod
+    def _normalize_job_type(cls, value):
+        """Map "Full-Time", "part time", etc. onto the enum; anything else is non-critical, so default it."""
+        key = "".join(c for c in value.lower() if c.isalpha()) if isinstance(value, str) else ""
+        return {"fulltime": "Full-time", "parttime": "Part-time"}.get(key, "Full-time")
+
+
+EXTRACTION_TOOL = {
+    "name": "extract_job_posting",
+    "description": (
+        "Record the details of a job posting. Use null for any field not found, "
+        "except job_type, which defaults to Full-time."
+    ),
+    "input_schema": JobDetails.model_json_schema(),
+}
+
+EXTRACTION_INSTRUCTIONS = """Extract job posting details from the content provided by the user and record them with the extract_job_posting tool.
+
+Important:
+- For company_name, look in both the job page AND the LinkedIn post content. Check the LinkedIn poster's profile/company, the post text, or the job page title/header. Never return null or "Unknown" if a company is mentioned anywhere.
+- Default job_type to "Full-time" if not specified
+- For location, combine all listed locations with semicolons
+- For compensation, include the full range as stated
+- For job_listed_date, look for any posting date, published date, or "posted X days/weeks ago" and convert to YYYY-MM-DD"""
+
+
+def _extract_with_feedback(model: str, prompt: str, retries: int) -> dict | None:
+    """Ask `model` to call the extraction tool, feeding validation errors back up to `retries` times."""
+    messages = [{"role": "user", "content": prompt}]
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(attempt)
+        response = claude.messages.create(
+            model=model,
+            max_tokens=EXTRACTION_MAX_TOKENS,
+            # Static rulebook goes in a cached system block; only the posting varies.
+            # NOTE: tools + instructions are only a few hundred tokens, below Anthropic's
+            # minimum cacheable prefix (1024 tokens for Sonnet 4, 4096 for Haiku 4.5), so this
+            # marker currently caches nothing. It only takes effect if the prefix grows
+            # past that minimum.
+            system=[{
+                "type": "text",
+                "text": EXTRACTION_INSTRUCTIONS,
+                "cache_control": {"type": "ephemeral"},
+            }],
+            tools=[EXTRACTION_TOOL],
+            tool_choice={"type": "tool", "name": EXTRACTION_TOOL["name"]},
+            messages=messages,
+        )
+        tool_use = next(block for block in response.content if block.type == "tool_use")
+        try:
+            return JobDetails.model_validate(tool_use.input).model_dump(mode="json")
+        except ValidationError as e:
+            log.warning(f"{model} returned invalid tool input (attempt {attempt + 1}): {e}")
+            messages += [
+                {"role": "assistant", "content": response.content},
+                {
+                    "role": "user",
+                    "content": [{
+                        "type": "tool_result",
+                        "tool_use_id": tool_use.id,
+                        "content": f"Invalid input: {e}. Call the tool again with values matching the schema.",
+                        "is_error": True,
+                    }],
+                },
+            ]
+    return None
+
+
 def extract_job_details(page_content: str, url: str, source_url: str | None, linkedin_post_content: str | None = None) -> dict | None:
     """Use Claude to extract structured job details from page content."""
     if not page_content and not linkedin_post_content:
@@ -148,62 +374,155 @@ def extract_job_details(page_content: str, url: str, source_url: str | None, lin
 
 """
     if page_content:
-        content_sections += f"""Job Page HTML Content:
+        content_sections += f"""Job Page Content (HTML, or JSON from the job board's API):
 {page_content}"""
 
-    prompt = f"""Extract job posting details from the content below.
-Return ONLY a JSON object with these fields (use null for any field not found):
-
-{{
-  "company_name": "Company name",
-  "open_role": "Job title",
-  "job_type": "Full-time or Part-time",
-  "location": "Location(s), semicolon-separated if multiple",
-  "compensation_range": "Salary/comp range if listed",
-  "link_to_apply": "Direct application URL if found in the page, otherwise null",
-  "job_listed_date": "Date the job was posted in YYYY-MM-DD format, or null if not found"
-}}
-
-Important:
-- For company_name, look in both the job page AND the LinkedIn post content. Check the LinkedIn poster's profile/company, the post text, or the job page title/header. Never return null or "Unknown" if a company is mentioned anywhere.
-- Default job_type to "Full-time" if not specified
-- For location, combine all listed locations with semicolons
-- For compensation, include the full range as stated
-- For job_listed_date, look for any posting date, published date, or "posted X days/weeks ago" and convert to YYYY-MM-DD
-- Only return the JSON, no other text
-
-URL of the posting: {url}
+    prompt = f"""URL of the posting: {url}
 
 {content_sections}"""
 
+    cache_key = llm_cache.make_key(
+        EXTRACTION_MODEL, PROMPT_VERSION, url, source_url or "",
+        page_content, linkedin_post_content or "",
+    )
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        log.info(f"Using cached extraction for {url}")
+        return cached
+
+    details = None
     try:
-        response = claude.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1000,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        text = response.content[0].text.strip()
-        # Clean up markdown code fences if present
-        text = re.sub(r"^```(?:json)?\s*", "", text)
-        text = re.sub(r"\s*```$", "", text)
-        return json.loads(text)
+        details = _extract_with_feedback(EXTRACTION_MODEL, prompt, retries=2)
+        if details is None:
+            log.warning(f"{EXTRACTION_MODEL} returned invalid details for {url}, retrying with {FALLBACK_MODEL}")
+    except anthropic.APIStatusError as e:
+        # Retired model, overload, bad request...: Sonnet may still be able to serve it
+        log.warning(f"{EXTRACTION_MODEL} request failed for {url} ({e.status_code}), retrying with {FALLBACK_MODEL}")
     except Exception as e:
         log.error(f"Claude extraction failed: {e}")
         return None
 
+    if details is None:
+        try:
+            details = _extract_with_feedback(FALLBACK_MODEL, prompt, retries=0)
+        except Exception as e:
+            log.error(f"Claude extraction failed: {e}")
+            return None
+    if details is None:
+        log.error(f"Claude extraction failed: no valid details for {url}")
+        return None
+
+    llm_cache.set(cache_key, details)
+    return details
+
+
+def load_known_urls() -> set[str]:
+    """Read the Link to Apply URLs already known to be in Notion."""
+    if os.path.exists(KNOWN_URLS_FILE):
+        with open(KNOWN_URLS_FILE, "r") as f:
+            return {line.strip() for line in f if line.strip()}
+    return set()
+
+
+def save_known_urls(links: set[str]):
+    """Rewrite the known-URLs sidecar from a full Notion scan (atomically, like last_ts)."""
+    tmp = KNOWN_URLS_FILE + ".tmp"
+    try:
+        with open(tmp, "w") as f:
+            f.writelines(link + "\n" for link in sorted(links))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, KNOWN_URLS_FILE)
+    except OSError as e:
+        log.warning(f"Failed to rewrite {KNOWN_URLS_FILE}: {e}")
+
+
+def remember_url(link: str):
+    """Record a Link to Apply URL as present in Notion (in memory and on disk)."""
+    if link in _SEEN_URLS:
+        return
+    _SEEN_URLS.add(link)
+    try:
+        with open(KNOWN_URLS_FILE, "a") as f:
+            f.write(link + "\n")
+    except OSError as e:
+        log.warning(f"Failed to persist known URL {link}: {e}")
+
+
+_property_ids: dict[str, str] | None = None  # Notion property name -> stable property ID
+
+
+def property_id(name: str) -> str | None:
+    """Look up a database property's ID, fetching the schema once and caching it."""
+    global _property_ids
+    if _property_ids is None:
+        try:
+            schema = notion.databases.retrieve(database_id=NOTION_DATABASE_ID)
+            _property_ids = {prop: info["id"] for prop, info in schema["properties"].items()}
+        except Exception as e:
+            raise_if_notion_rate_limited(e)
+            log.warning(f"Failed to retrieve Notion database schema: {e}")
+            return None
+    return _property_ids.get(name)
+
+
+# Links known to exist in Notion, so repeat dedup checks skip the API round-trip.
+# Seeded from the sidecar only until the first full scan replaces it.
+_SEEN_URLS = load_known_urls()
+_links_loaded_at: float | None = None  # monotonic time of the last full Notion scan
+
+
+def load_existing_links():
+    """Page through the Notion database once and cache every existing Link to Apply URL."""
+    global _links_loaded_at
+    if _links_loaded_at is not None and time.monotonic() - _links_loaded_at < LINKS_REFRESH_SECONDS:
+        return
+    query = {"database_id": NOTION_DATABASE_ID, "page_size": 100}
+    link_prop_id = property_id("Link to Apply")
+    if link_prop_id:
+        # Only return the one column we need
+        query["filter_properties"] = [link_prop_id]
+    try:
+        links = set()
+        for page in iterate_paginated_api(notion.databases.query, **query):
+            link = page["properties"].get("Link to Apply", {}).get("url")
+            if link:
+                links.add(link)
+    except Exception as e:
+        raise_if_notion_rate_limited(e)
+        log.warning(f"Failed to load existing Notion links: {e}")
+        return
+    # The scan is the source of truth: rows deleted in Notion stop counting as duplicates
+    _SEEN_URLS.clear()
+    _SEEN_URLS.update(links)
+    save_known_urls(links)
+    _links_loaded_at = time.monotonic()
+    log.info(f"Loaded {len(links)} existing link(s) from Notion")
+
 
 def is_duplicate(link_to_apply: str) -> bool:
     """Check if an entry with this Link to Apply URL already exists in Notion."""
+    if link_to_apply in _SEEN_URLS:
+        log.info(f"⏭️ Duplicate found for {link_to_apply}, skipping.")
+        return True
+    if _links_loaded_at is not None:
+        return False
+    # Bulk prefetch hasn't succeeded yet, so ask Notion about this one URL
     try:
         results = notion.databases.query(
             database_id=NOTION_DATABASE_ID,
-            filter={"property": "Link to Apply", "url": {"equals": link_to_apply}},
+            filter={
+                "property": property_id("Link to Apply") or "Link to Apply",
+                "url": {"equals": link_to_apply},
+            },
             page_size=1,
         )
         if results["results"]:
             log.info(f"⏭️ Duplicate found for {link_to_apply}, skipping.")
+            remember_url(link_to_apply)
             return True
     except Exception as e:
+        raise_if_notion_rate_limited(e)
         log.warning(f"Dedup check failed: {e}")
     return False
 
@@ -236,8 +555,8 @@ def create_notion_entry(details: dict, source: str, job_listed_date: str | None)
         properties["Link to Apply"] = {"url": link}
 
     # Select property
-    job_type = details.get("job_type", "Full-time")
-    if job_type in ("Full-time", "Part-time"):
+    job_type = details.get("job_type")
+    if job_type:
         properties["Job Type"] = {"select": {"name": job_type}}
 
     # Date property
@@ -246,9 +565,12 @@ def create_notion_entry(details: dict, source: str, job_listed_date: str | None)
 
     try:
         notion.pages.create(parent={"database_id": NOTION_DATABASE_ID}, properties=properties)
+        if link:
+            remember_url(link)
         log.info(f"✅ Added to Notion: {details.get('company_name')} — {details.get('open_role')}")
         return True
     except Exception as e:
+        raise_if_notion_rate_limited(e)
         log.error(f"Notion creation failed: {e}")
         return False
 
@@ -256,70 +578,89 @@ def create_notion_entry(details: dict, source: str, job_listed_date: str | None)
 def post_slack_reaction(channel: str, timestamp: str, emoji: str = "white_check_mark"):
     """Add a reaction to a Slack message to indicate it's been processed."""
     try:
-        requests.post(
+        SESSION.post(
             "https://slack.com/api/reactions.add",
-            headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"},
+            headers=SLACK_HEADERS,
             json={"channel": channel, "timestamp": timestamp, "name": emoji},
         )
     except Exception:
         pass  # Non-critical
 
 
+def fetch_new_messages(oldest: str) -> list[dict] | None:
+    """Page through Slack history newer than `oldest`. Returns None on API error."""
+    messages = []
+    cursor = None
+    while True:
+        params = {
+            "channel": SLACK_CHANNEL_ID,
+            "oldest": oldest,
+            "inclusive": "false",
+            "limit": 200,
+        }
+        if cursor:
+            params["cursor"] = cursor
+        resp = SESSION.get(
+            "https://slack.com/api/conversations.history",
+            headers=SLACK_HEADERS,
+            params=params,
+        )
+        if resp.status_code == 429:
+            raise SlackRateLimited(int(resp.headers.get("Retry-After", "30")))
+        data = orjson.loads(resp.content)
+        if not data.get("ok"):
+            log.error(f"Slack API error: {data.get('error')}")
+            return None
+        messages.extend(data.get("messages", []))
+        cursor = data.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return messages
+
+
 # ── Main Loop ───────────────────────────────────────────────────────────────
-def poll_and_process():
-    """Main function: read new Slack messages, extract job details, update Notion."""
+def poll_and_process() -> int:
+    """Main function: read new Slack messages, extract job details, update Notion.
+
+    Returns the number of new messages seen. Raises SlackRateLimited/NotionRateLimited
+    on a 429; last_ts is not advanced past a message whose Notion write was rate limited.
+    """
     last_ts = get_last_processed_ts()
     log.info(f"Polling Slack since ts={last_ts}")
 
-    # Fetch messages from Slack
-    resp = requests.get(
-        "https://slack.com/api/conversations.history",
-        headers={"Authorization": f"Bearer {SLACK_BOT_TOKEN}"},
-        params={
-            "channel": SLACK_CHANNEL_ID,
-            "oldest": last_ts,
-            "limit": 50,
-        },
-    )
-    data = resp.json()
-    if not data.get("ok"):
-        log.error(f"Slack API error: {data.get('error')}")
-        return
-
-    messages = data.get("messages", [])
+    messages = fetch_new_messages(last_ts)
+    if messages is None:
+        return 0
     if not messages:
         log.info("No new messages.")
-        return
+        return 0
 
-    # Process oldest first
-    messages.sort(key=lambda m: float(m["ts"]))
-    latest_ts = last_ts
+    load_existing_links()
 
+    # Process oldest first; messages without URLs are skipped but still advance last_ts
     for msg in messages:
+        msg["_ts_f"] = float(msg["ts"])  # parse once; reused for sorting and the fallback date
+    messages.sort(key=lambda m: m["_ts_f"])
+    latest_ts = messages[-1]["ts"]
+
+    # Categorize URLs for every message up front so LinkedIn posts can be fetched together
+    batch = []
+    for msg in messages:
+        urls = extract_urls(msg.get("text", ""))
+        if urls:
+            batch.append((msg, urls, *categorize_urls(urls)))
+
+    # Fetch LinkedIn post content concurrently (used for company name extraction)
+    post_urls = list({post_url for _, _, post_url, _ in batch if post_url})
+    for post_url in post_urls:
+        log.info(f"Fetching LinkedIn post for context: {post_url}")
+    post_contents = dict(zip(post_urls, EXECUTOR.map(fetch_page_content, post_urls)))
+
+    jobs = []  # one entry per job URL to extract, in message order
+    for msg, urls, linkedin_post_url, job_urls in batch:
         text = msg.get("text", "")
         ts = msg["ts"]
-        urls = extract_urls(text)
-
-        if not urls:
-            continue
-
         log.info(f"Processing message with {len(urls)} URL(s): {urls}")
-
-        # Categorize URLs
-        linkedin_post_url = None
-        job_urls = []
-
-        for u in urls:
-            if "linkedin.com" in u and ("/feed/" in u or "/posts/" in u or "activity" in u):
-                linkedin_post_url = u
-            else:
-                job_urls.append(u)
-
-        # Fetch LinkedIn post content if available (used for company name extraction)
-        linkedin_post_content = None
-        if linkedin_post_url:
-            log.info(f"Fetching LinkedIn post for context: {linkedin_post_url}")
-            linkedin_post_content = fetch_page_content(linkedin_post_url)
+        linkedin_post_content = post_contents.get(linkedin_post_url)
 
         # If only LinkedIn post URL, scan for embedded job links
         if not job_urls and linkedin_post_url:
@@ -340,17 +681,45 @@ def poll_and_process():
             linkedin_date = decode_linkedin_activity_date(linkedin_post_url)
 
         # Fallback date: use Slack message timestamp
-        slack_date = datetime.fromtimestamp(float(ts), tz=timezone.utc).strftime("%Y-%m-%d")
+        slack_date = datetime.fromtimestamp(msg["_ts_f"], tz=timezone.utc).date().isoformat()
 
+        # Pass LinkedIn post content for better company name extraction
+        # Also include the original Slack message text as fallback context
+        slack_ctx = f"Slack message text: {text}\n\n" if text else ""
         for job_url in job_urls:
-            log.info(f"Fetching: {job_url}")
-            content = fetch_page_content(job_url)
-            # Pass LinkedIn post content for better company name extraction
-            # Also include the original Slack message text as fallback context
             post_ctx = linkedin_post_content if (job_url != linkedin_post_url) else None
-            slack_ctx = f"Slack message text: {text}\n\n" if text else ""
-            combined_post_ctx = (slack_ctx + (post_ctx or "")).strip() or None
-            details = extract_job_details(content, job_url, source_url, linkedin_post_content=combined_post_ctx)
+            jobs.append({
+                "ts": ts,
+                "job_url": job_url,
+                "source_url": source_url,
+                "post_ctx": (slack_ctx + (post_ctx or "")).strip() or None,
+                # The LinkedIn post itself was already fetched above
+                "content": linkedin_post_content if job_url == linkedin_post_url else None,
+                "linkedin_date": linkedin_date,
+                "slack_date": slack_date,
+            })
+
+    # Fetch all job pages concurrently, then run the Claude extractions the same way
+    to_fetch = [job for job in jobs if job["content"] is None]
+    for job in to_fetch:
+        log.info(f"Fetching: {job['job_url']}")
+    for job, content in zip(to_fetch, EXECUTOR.map(fetch_page_content, [j["job_url"] for j in to_fetch])):
+        job["content"] = content
+
+    futures = [
+        EXECUTOR.submit(
+            extract_job_details, job["content"], job["job_url"], job["source_url"],
+            linkedin_post_content=job["post_ctx"],
+        )
+        for job in jobs
+    ]
+
+    # Notion writes stay sequential and in message order (dedup relies on it);
+    # progress is saved after each message so a crash doesn't redo finished work
+    for ts, group in groupby(zip(jobs, futures), key=lambda pair: pair[0]["ts"]):
+        for job, future in group:
+            job_url = job["job_url"]
+            details = future.result()
 
             if details:
                 # Use the direct job URL as Link to Apply if Claude didn't find one
@@ -358,24 +727,28 @@ def poll_and_process():
                     details["link_to_apply"] = job_url
 
                 # Date priority: Claude-extracted > LinkedIn activity ID > Slack message date
-                job_date = details.pop("job_listed_date", None) or linkedin_date or slack_date
+                job_date = details.pop("job_listed_date", None) or job["linkedin_date"] or job["slack_date"]
 
                 success = create_notion_entry(
                     details=details,
-                    source=source_url,
+                    source=job["source_url"],
                     job_listed_date=job_date,
                 )
+                # Reactions are fire-and-forget, so don't block the Notion writes on them
                 if success:
-                    post_slack_reaction(SLACK_CHANNEL_ID, ts)
+                    EXECUTOR.submit(post_slack_reaction, SLACK_CHANNEL_ID, ts)
             else:
                 log.warning(f"Could not extract details from {job_url}")
-                post_slack_reaction(SLACK_CHANNEL_ID, ts, "warning")
-
-        latest_ts = ts
+                EXECUTOR.submit(post_slack_reaction, SLACK_CHANNEL_ID, ts, "warning")
+        save_last_processed_ts(ts)
 
     save_last_processed_ts(latest_ts)
     log.info(f"Done. Processed {len(messages)} messages. Last ts={latest_ts}")
+    return len(messages)
 
 
 if __name__ == "__main__":
-    poll_and_process()
+    try:
+        poll_and_process()
+    except RateLimited as e:
+        log.warning(f"{e.service} rate limited this run; retry after {e.retry_after}s")
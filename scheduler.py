@@ -1,23 +1,48 @@
 """
 Simple scheduler — runs poll_and_process() every 30 seconds.
+Backs off while the channel is quiet (up to 5 minutes) and when Slack or Notion rate-limits.
 Used as the entry point on Railway/Render.
 """
 
-import time
+import signal
 import logging
-from main import poll_and_process
+import threading
+from main import poll_and_process, RateLimited
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 log = logging.getLogger(__name__)
 
 INTERVAL_SECONDS = 30  # 30 seconds
+MAX_IDLE_INTERVAL_SECONDS = 300  # cap for the quiet-channel backoff
+
+# Set by SIGTERM so a deploy interrupts the sleep instead of waiting it out.
+# SIGINT keeps its default handler, so Ctrl-C still stops a hung poll.
+stop = threading.Event()
+
+
+def handle_signal(signum, frame):
+    log.info(f"Received signal {signum}, shutting down after the current poll.")
+    stop.set()
+
 
 if __name__ == "__main__":
+    signal.signal(signal.SIGTERM, handle_signal)
+
     log.info("🚀 Growth Hirings Tracker started. Polling every 30 seconds.")
-    while True:
+    empty_polls = 0
+    while not stop.is_set():
+        sleep_seconds = INTERVAL_SECONDS
         try:
-            poll_and_process()
+            if poll_and_process():
+                empty_polls = 0
+            else:
+                empty_polls += 1
+                # Double the wait for each consecutive empty poll
+                sleep_seconds = min(INTERVAL_SECONDS * 2 ** empty_polls, MAX_IDLE_INTERVAL_SECONDS)
+        except RateLimited as e:
+            log.warning(str(e))
+            sleep_seconds = max(e.retry_after, INTERVAL_SECONDS)
         except Exception as e:
             log.error(f"Error during poll: {e}", exc_info=True)
-        log.info(f"Sleeping {INTERVAL_SECONDS}s until next poll...")
-        time.sleep(INTERVAL_SECONDS)
+        log.info(f"Sleeping {sleep_seconds}s until next poll...")
+        stop.wait(sleep_seconds)